@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Base Textual Application"""
-from os import getlogin
-from datetime import datetime
+from os import environ, getlogin, path
+import time
+from queue import Empty, SimpleQueue
+from types import MappingProxyType
+from rich.markup import render as _render_markup
+from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, Grid
 from textual.screen import ModalScreen
+from textual.worker import get_current_worker
 from textual.widgets import (
         Button,
         Footer,
@@ -17,14 +22,38 @@ from textual.widgets import (
         RichLog,
         )
 
-# 'package' (script) meta
-metadata = {
+# 'package' (script) meta, read-only
+metadata = MappingProxyType({
     'title': 'Textual Application',
     'author': 'Josh Lay <me+fedora@jlay.io>',
     'creation_date': '2023-06-29',
     'version': '1.0.0',
     'description': '''This is a basic Textual TUI. Used as the foundation for other projects'''
-}
+})
+
+# static 'About' tab content, built (and markup parsed) once rather than on every compose
+_AUTHOR_TEXT = _render_markup(f"by [italic]{metadata['author']}[/]")
+_ABOUT_LABELS = (
+    Text(f"{metadata['title']} v{metadata['version']}"),
+    Text(metadata['description']),
+    _AUTHOR_TEXT,
+    )
+
+# prefer the environment over a getlogin() syscall on the startup path
+_LOGIN = environ.get("USER") or environ.get("LOGNAME") or getlogin()
+
+# log timestamp prefix, only reformatted when the wall-clock second changes
+_ts_cache = {"sec": 0, "str": ""}
+
+
+def _log_prefix() -> str:
+    """Return the log timestamp for the current second, formatting it at most once per second"""
+    sec = int(time.time())
+    if sec != _ts_cache["sec"]:
+        _ts_cache["sec"] = sec
+        _ts_cache["str"] = time.strftime("%b %d %H:%M:%S", time.localtime(sec))
+    return _ts_cache["str"]
+
 
 class QuitScreen(ModalScreen):
     """Screen with a dialog to quit. Shown when user presses keybind"""
@@ -60,7 +89,7 @@ class TextualApp(App):
             Binding("s", "custom_screenshot", "Screenshot"),
             Binding("q", "request_quit", "Quit")
             )
-    SCREENS = {"quit_screen": QuitScreen()}
+    SCREENS = {"quit_screen": QuitScreen}
 
     selected_path = None
     tabbed_container = None
@@ -69,14 +98,10 @@ class TextualApp(App):
     def __init__(self, *args, **kwargs):
         """On startup of the TUI, initialize objects/vars"""
         super().__init__(*args, **kwargs)
-        self.tabbed_container = TabbedContent(id="tabbed_content_main",
-                                              classes='tabbed_container')
-        self.text_log = RichLog(id="main_textlog",
-                                markup=True,
-                                highlight=True,
-                                classes='logs')
-
-    @work(exclusive=True)
+        self._log_queue = SimpleQueue()
+        self._log_worker = None
+        self._last_notify = ("", 0.0)
+
     async def action_custom_dark(self) -> None:
         """An action to toggle dark mode. Wraps 'action_toggle_dark' with our logging"""
         self.app.dark = not self.app.dark
@@ -88,41 +113,89 @@ class TextualApp(App):
 
     def get_screenshot_name(self) -> str:
         """Using the current date and time, return a name for the requested screenshot"""
-        return f'screenshot_{datetime.now().isoformat().replace(":", "_")}.svg'
+        return time.strftime("screenshot_%Y-%m-%dT%H_%M_%S.svg")
 
     async def action_custom_screenshot(self, screen_dir: str = '/tmp') -> None:
         """Action that fires when the user presses 's' for a screenshot"""
-        # take the screenshot, recording the path for logging/notification
-        outpath = self.save_screenshot(path=screen_dir, filename=self.get_screenshot_name())
+        # render the SVG here while the screen is consistent; the disk write happens in a thread
+        outpath = path.join(screen_dir, self.get_screenshot_name())
+        self._write_screenshot(outpath, self.export_screenshot())
+
+    @work(thread=True, exclusive=True, group="screenshot")
+    def _write_screenshot(self, outpath: str, svg: str) -> None:
+        """Thread worker: write the rendered screenshot to disk, then log/notify"""
+        with open(outpath, "w", encoding="utf-8") as screenshot:
+            screenshot.write(svg)
         # construct the log/notification message, then show it
-        await self.update_log(f"[bold]Screenshot saved: [green]'{outpath}'", notify=True)
+        self.call_from_thread(self.update_log, f"[bold]Screenshot saved: [green]'{outpath}'",
+                              notify=True)
 
     def compose(self) -> ComposeResult:
         """Craft the main window/widgets"""
         yield Header(show_clock=True)
+        # widgets are created on first compose, not in __init__, so unmounted apps skip them
+        if self.text_log is None:
+            self.tabbed_container = TabbedContent(id="tabbed_content_main",
+                                                  classes='tabbed_container')
+            self.text_log = RichLog(id="main_textlog",
+                                    markup=False,
+                                    highlight=False,
+                                    classes='logs')
         with self.tabbed_container:
             with TabPane("Main", id="tab_main"):
                 yield self.text_log
             with TabPane("About", id="tab_about"):
-                yield Vertical(
-                        Label(f"{metadata['title']} v{metadata['version']}"),
-                        Label(f"{metadata['description']}"),
-                        Label(f"by [italic]{metadata['author']}[/]", markup=True)
-                        )
+                yield Vertical(*(Label(text) for text in _ABOUT_LABELS))
         yield Footer()
 
     async def on_mount(self) -> None:
         """Fires when widget 'mounted', behaves like on-first-showing"""
-        await self.update_log(f"Hello, {getlogin()} :)", notify=True)
+        self._log_worker = self.run_worker(self._log_consumer, thread=True,
+                                           group="logs", exclusive=False)
+        await self.update_log(f"Hello, {_LOGIN} :)", notify=True)
 
     async def update_log(self, message: str, timestamp: bool = True, notify: bool = False) -> None:
-        """Write to the main RichLog widget, optional timestamps and notifications"""
-        if timestamp:
-            self.text_log.write(datetime.now().strftime("%b %d %H:%M:%S") + ': ' + message)
-        else:
-            self.text_log.write(message)
-        if notify:
-            self.notify(message)
+        """Queue a message for the main RichLog widget, optional timestamps and notifications"""
+        self._log_queue.put_nowait((message, timestamp, notify))
+
+    def _log_consumer(self) -> None:
+        """Thread worker: drain queued messages, format them, hand them to the RichLog"""
+        worker = get_current_worker()
+        while not worker.is_cancelled:
+            try:
+                records = [self._log_queue.get(timeout=0.5)]
+            except Empty:
+                continue
+            # coalesce everything queued during a burst into a single batch
+            while True:
+                try:
+                    records.append(self._log_queue.get_nowait())
+                except Empty:
+                    break
+            lines = []
+            notices = []
+            for message, timestamp, notify in records:
+                if timestamp:
+                    line = f"{_log_prefix()}: {message}"
+                else:
+                    line = message
+                # only pay for markup parsing when the line could contain any
+                lines.append(Text.from_markup(line) if '[' in message else line)
+                if notify:
+                    notices.append(message)
+            self.call_from_thread(self._write_logs, lines, notices)
+
+    def _write_logs(self, lines: list, notices: list) -> None:
+        """Write a batch of formatted lines to the main RichLog widget, then notify"""
+        with self.batch_update():
+            for line in lines:
+                self.text_log.write(line)
+        for message in notices:
+            # drop repeats of the notification just shown, eg: rapid toggling
+            now = time.monotonic()
+            if message != self._last_notify[0] or now - self._last_notify[1] > 1.0:
+                self.notify(message)
+                self._last_notify = (message, now)
 
 
 if __name__ == "__main__":